@@ -0,0 +1,128 @@
+"""httpx transport that performs network I/O with aiohttp"""
+
+import asyncio
+import contextlib
+from typing import Any, AsyncIterator, Iterator
+
+import httpx
+
+try:
+    import aiohttp
+    import yarl
+except ImportError:  # aiohttp is an optional dependency
+    aiohttp = None  # type: ignore[assignment]
+    yarl = None  # type: ignore[assignment]
+
+# aiohttp 3.10+ raises a dedicated error for connect timeouts; older versions
+# report them as the generic ServerTimeoutError, which maps to ReadTimeout
+_ConnectTimeoutError: Any = getattr(aiohttp, "ConnectionTimeoutError", ())
+
+# Framing and hop-by-hop headers are recomputed by aiohttp for the body it sends
+_SKIP_HEADERS = frozenset({"transfer-encoding", "content-length", "host", "connection", "keep-alive"})
+
+
+class AiohttpTransport(httpx.AsyncBaseTransport):
+    """
+    Send httpx requests through an aiohttp ClientSession.
+
+    The Dakora client keeps its httpx-based API (requests, responses and errors
+    are all httpx objects); only the connection pool and wire I/O are handled by
+    aiohttp, which is faster for high-concurrency render workloads.
+
+    Response bodies are streamed, so ``Dakora._stream`` and ``list_iter`` still
+    read incrementally. Only the connect and read phases of an httpx timeout
+    are applied; aiohttp has no equivalent of the write and pool timeouts, so
+    those are ignored.
+    """
+
+    def __init__(self, limits: httpx.Limits):
+        if aiohttp is None:
+            raise ImportError(
+                "aiohttp is required to use transport='aiohttp'. "
+                "Install with: pip install 'dakora-client[aiohttp]'"
+            )
+        self._limits = limits
+        self._session: Any = None
+
+    def _get_session(self) -> Any:
+        # The session binds to the running loop, so it is created on first use
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=self._limits.max_connections or 0,
+                keepalive_timeout=self._limits.keepalive_expiry,
+            )
+            # httpx decodes Content-Encoding itself from the response headers
+            self._session = aiohttp.ClientSession(connector=connector, auto_decompress=False)
+        return self._session
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        timeouts = request.extensions.get("timeout", {})
+        timeout = aiohttp.ClientTimeout(
+            sock_connect=timeouts.get("connect"),
+            sock_read=timeouts.get("read"),
+        )
+        headers = [(k, v) for k, v in request.headers.multi_items() if k.lower() not in _SKIP_HEADERS]
+        data: Any = None
+        if "content-length" in request.headers:
+            data = await request.aread() or None
+        elif "transfer-encoding" in request.headers:
+            # Streamed body of unknown length (e.g. a large create()): aiohttp sends it chunked
+            data = _iter_stream(request.stream)
+
+        with _map_errors(request):
+            response = await self._get_session().request(
+                request.method,
+                yarl.URL(str(request.url), encoded=True),
+                headers=headers,
+                data=data,
+                timeout=timeout,
+                allow_redirects=False,
+            )
+
+        return httpx.Response(
+            status_code=response.status,
+            headers=list(response.raw_headers),
+            stream=_AiohttpResponseStream(response, request),
+            extensions={"http_version": f"HTTP/{response.version.major}.{response.version.minor}".encode()},
+        )
+
+    async def aclose(self) -> None:
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+
+class _AiohttpResponseStream(httpx.AsyncByteStream):
+    """Response body read from aiohttp as it arrives; releases the connection on close."""
+
+    def __init__(self, response: Any, request: httpx.Request):
+        self._response = response
+        self._request = request
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        with _map_errors(self._request):
+            async for chunk in self._response.content.iter_any():
+                yield chunk
+
+    async def aclose(self) -> None:
+        self._response.release()
+
+
+@contextlib.contextmanager
+def _map_errors(request: httpx.Request) -> Iterator[None]:
+    """Re-raise aiohttp errors as the httpx exceptions callers already handle."""
+    try:
+        yield
+    except _ConnectTimeoutError as e:
+        raise httpx.ConnectTimeout(str(e) or "Connection timed out", request=request) from e
+    except (asyncio.TimeoutError, aiohttp.ServerTimeoutError) as e:
+        raise httpx.ReadTimeout(str(e) or "Request timed out", request=request) from e
+    except aiohttp.ClientConnectionError as e:
+        raise httpx.ConnectError(str(e), request=request) from e
+    except aiohttp.ClientError as e:
+        raise httpx.TransportError(str(e), request=request) from e
+
+
+async def _iter_stream(stream: Any) -> AsyncIterator[bytes]:
+    async for chunk in stream:
+        yield chunk
@@ -0,0 +1,75 @@
+"""JSON helpers that use orjson and ijson when they are installed"""
+
+import json
+from typing import Any, AsyncIterator
+
+import httpx
+
+try:
+    import orjson
+except ImportError:  # orjson is an optional speedup
+    orjson = None  # type: ignore[assignment]
+
+try:
+    import ijson
+except ImportError:  # ijson is an optional speedup
+    ijson = None  # type: ignore[assignment]
+
+JSON_HEADERS = {"Content-Type": "application/json"}
+
+
+def dumps(obj: Any) -> bytes:
+    """Serialize ``obj`` to JSON bytes."""
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+        except orjson.JSONEncodeError:
+            # e.g. integers beyond 64 bits, which the stdlib encoder accepts
+            pass
+    return json.dumps(obj).encode("utf-8")
+
+
+def loads(response: httpx.Response) -> Any:
+    """Deserialize a JSON response body straight from its bytes."""
+    if orjson is not None:
+        return orjson.loads(response.content)
+    return response.json()
+
+
+async def iter_dumps_with_string(obj: dict[str, Any], key: str, value: str, chunk_chars: int) -> AsyncIterator[bytes]:
+    """Serialize ``{**obj, key: value}`` as a stream of JSON byte chunks.
+
+    The potentially large string ``value`` is encoded ``chunk_chars`` characters
+    at a time, so its full JSON encoding never has to exist in memory at once.
+    ``obj`` must be non-empty and must not already contain ``key``.
+    """
+    head = dumps(obj)
+    yield head[:-1] + b"," + dumps(key) + b':"'
+    for start in range(0, len(value), chunk_chars):
+        # Each slice encodes to a quoted JSON string; drop the quotes to splice it in
+        yield dumps(value[start:start + chunk_chars])[1:-1]
+    yield b'"}'
+
+
+async def aiter_array_items(response: httpx.Response) -> AsyncIterator[Any]:
+    """Yield the items of a streamed JSON array response as they arrive.
+
+    With ijson installed the body is parsed incrementally; otherwise it is read
+    in full and decoded in one go.
+    """
+    if ijson is None:
+        await response.aread()
+        for item in loads(response):
+            yield item
+        return
+
+    ready = ijson.sendable_list()
+    parser = ijson.items_coro(ready, "item")
+    async for chunk in response.aiter_bytes():
+        parser.send(chunk)
+        for item in ready:
+            yield item
+        del ready[:]
+    parser.close()
+    for item in ready:
+        yield item
@@ -0,0 +1,118 @@
+"""Opt-in event loop lag and task timing for the Dakora client"""
+
+import asyncio
+import logging
+from typing import Any, Callable, Coroutine
+
+logger = logging.getLogger("dakora_client.profiling")
+
+ProfileCallback = Callable[[str, float], None]
+
+LOOP_LAG = "loop_lag"
+
+# Coroutines whose tasks are timed by the task factory hook
+_TRACKED_PREFIXES = ("PromptsAPI.", "TracesAPI.", "Dakora.")
+
+
+class LoopProfiler:
+    """
+    Detect blocking work on the event loop used by a Dakora client.
+
+    A probe callback is rescheduled every ``interval`` seconds and compares when
+    it actually ran with when it was due; drift above ``lag_threshold`` means
+    something blocked the loop. A task factory hook additionally times every
+    task created from a Dakora coroutine. Both are reported through
+    ``callback(name, seconds)``, where name is ``"loop_lag"`` or the coroutine's
+    qualified name. Without a callback, lag is logged as a warning and task
+    timings at debug level.
+    """
+
+    def __init__(
+        self,
+        callback: ProfileCallback | None = None,
+        interval: float = 0.05,
+        lag_threshold: float = 0.01,
+    ):
+        self._callback = callback
+        self._interval = interval
+        self._lag_threshold = lag_threshold
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._handle: asyncio.TimerHandle | None = None
+        self._expected = 0.0
+        self._previous_factory: Any = None
+        # Loop whose task factory chain includes ours; may outlive _loop (see stop)
+        self._linked_loop: asyncio.AbstractEventLoop | None = None
+
+    def ensure_started(self) -> None:
+        """Install the probe and task factory on the running loop (once per loop)."""
+        loop = asyncio.get_running_loop()
+        if self._loop is loop:
+            return
+        self.stop()
+        self._loop = loop
+        if self._linked_loop is not loop:
+            self._previous_factory = loop.get_task_factory()
+            loop.set_task_factory(self._task_factory)
+            self._linked_loop = loop
+        self._schedule()
+
+    def stop(self) -> None:
+        """Remove the probe and restore the previous task factory."""
+        if self._handle is not None:
+            self._handle.cancel()
+            self._handle = None
+        if self._loop is not None and not self._loop.is_closed():
+            # A factory installed after ours may still delegate to it, so it can only be
+            # unlinked when it is on top; otherwise it stays as a pass-through (see _task_factory)
+            if self._loop.get_task_factory() == self._task_factory:
+                self._loop.set_task_factory(_unlink_stopped(self))
+        self._loop = None
+
+    def _schedule(self) -> None:
+        assert self._loop is not None
+        self._expected = self._loop.time() + self._interval
+        self._handle = self._loop.call_at(self._expected, self._sample)
+
+    def _sample(self) -> None:
+        assert self._loop is not None
+        lag = self._loop.time() - self._expected
+        if lag > self._lag_threshold:
+            if self._callback is not None:
+                self._callback(LOOP_LAG, lag)
+            else:
+                logger.warning("Event loop blocked for %.1f ms", lag * 1000)
+        self._schedule()
+
+    def _task_factory(
+        self, loop: asyncio.AbstractEventLoop, coro: Coroutine[Any, Any, Any], **kwargs: Any
+    ) -> "asyncio.Future[Any]":
+        if self._previous_factory is not None:
+            task = self._previous_factory(loop, coro, **kwargs)
+        else:
+            task = asyncio.Task(coro, loop=loop, **kwargs)
+
+        if self._loop is None:
+            return task
+        name = getattr(coro, "__qualname__", "")
+        if name.startswith(_TRACKED_PREFIXES):
+            started = loop.time()
+            task.add_done_callback(lambda _: self._report_task(name, loop.time() - started))
+        return task
+
+    def _report_task(self, name: str, seconds: float) -> None:
+        if self._callback is not None:
+            self._callback(name, seconds)
+        else:
+            logger.debug("%s took %.1f ms", name, seconds * 1000)
+
+
+def _unlink_stopped(profiler: LoopProfiler) -> Any:
+    """Detach ``profiler`` and any stopped profilers below it; return the factory to install."""
+    while True:
+        previous = profiler._previous_factory
+        profiler._previous_factory = None
+        profiler._linked_loop = None
+        below = getattr(previous, "__self__", None)
+        if not isinstance(below, LoopProfiler) or below._loop is not None:
+            return previous
+        profiler = below
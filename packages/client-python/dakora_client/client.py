@@ -1,13 +1,29 @@
 
 """Dakora Platform Client"""
 
+import asyncio
 import os
 import logging
+import time
 import httpx
-from typing import Any
+from typing import Any, cast
+
+from . import _json
+from ._profiling import LoopProfiler, ProfileCallback
+from .prompts import PromptsAPI
+from .traces import TracesAPI
 
 logger = logging.getLogger("dakora_client")
 
+# Adaptive timeouts: per-path EWMA of latency, scaled into a timeout budget
+_LATENCY_EWMA_ALPHA = 0.2
+_LATENCY_DEFAULT_S = 5.0
+_TIMEOUT_LATENCY_MULTIPLIER = 4.0
+_TIMEOUT_MIN_S = 1.0
+_TIMEOUT_MAX_S = 120.0
+# Oldest routes are forgotten once this many have latency estimates
+_LATENCY_MAX_ROUTES = 256
+
 
 class Dakora:
     """
@@ -52,6 +68,12 @@ class Dakora:
         api_key: str | None = None,
         base_url: str | None = None,
         project_id: str | None = None,
+        coalesce_renders: bool = False,
+        coalesce_window_ms: float = 3.0,
+        adaptive_timeouts: bool = False,
+        transport: str = "httpx",
+        profile: bool = False,
+        profile_callback: ProfileCallback | None = None,
     ):
         """
         Initialize Dakora client
@@ -61,81 +83,201 @@ class Dakora:
             base_url: Base URL of the Dakora API server. Defaults to DAKORA_BASE_URL environment
                      variable, or https://api.dakora.io if not set.
             project_id: Project ID (optional). If not provided, will be fetched from /api/me/context.
+            coalesce_renders: If True, concurrent prompts.render() calls are grouped into
+                             batched requests (default: False).
+            coalesce_window_ms: How long to wait for more render calls before sending a
+                               batch, in milliseconds (default: 3.0).
+            adaptive_timeouts: If True, requests without an explicit timeout get one derived
+                              from the recent latency of the same path instead of the flat
+                              30 second default (default: False).
+            transport: Network backend, "httpx" (default) or "aiohttp". The aiohttp backend
+                      can be faster for high-concurrency bulk rendering and requires the
+                      aiohttp extra.
+            profile: If True, monitor the event loop for blocking calls and time tasks running
+                    Dakora coroutines (default: False).
+            profile_callback: Receives (name, seconds) for each profiling sample, where name is
+                             "loop_lag" or a coroutine name. Defaults to logging.
         """
         api_key_value = api_key or os.getenv("DAKORA_API_KEY")
         self.__api_key: str | None = api_key_value
         self._base_url = (
             base_url or os.getenv("DAKORA_BASE_URL") or "https://api.dakora.io"
         ).rstrip("/")
-
-        logger.debug(
-            f"Initializing Dakora client: base_url={self.base_url}, "
-            f"api_key={'present' if self.has_api_key() else 'none'}, "
-            f"project_id={project_id or 'auto'}"
+        self._origin = httpx.URL(self._base_url)
+
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "Initializing Dakora client: base_url=%s, api_key=%s, project_id=%s",
+                self.base_url,
+                "present" if self.has_api_key() else "none",
+                project_id or "auto",
+            )
+
+        limits = httpx.Limits(
+            max_keepalive_connections=20,
+            max_connections=100,
+            keepalive_expiry=60.0,
         )
+        if transport == "httpx":
+            http_transport = None
+        elif transport == "aiohttp":
+            from ._aiohttp_transport import AiohttpTransport
+
+            http_transport = AiohttpTransport(limits)
+        else:
+            raise ValueError(f"Unknown transport: {transport!r} (expected 'httpx' or 'aiohttp')")
 
         self.__http = httpx.AsyncClient(
             base_url=self.base_url,
             headers=self.__build_default_headers(),
             timeout=30.0,
+            http2=True,
+            limits=limits,
+            transport=http_transport,
         )
 
+        # Requests go straight to httpx unless adaptive timeouts are enabled
+        self._latency_ewma: dict[str, float] = {}
+        self.__send = self.__timed_request if adaptive_timeouts else self.__http.request
+
+        # Started now if an event loop is running, otherwise on the first request
+        self._profiler = LoopProfiler(profile_callback) if profile else None
+        if self._profiler is not None:
+            try:
+                self._profiler.ensure_started()
+            except RuntimeError:
+                pass
+
         # Lazy-loaded project context (or explicitly provided)
         self._project_id: str | None = project_id
+        # Ensures concurrent cold-start callers share a single context request
+        self._project_id_lock = asyncio.Lock()
+        self._prompts_base_url: str | None = None
 
-        # Import here to avoid circular dependency
-        from .prompts import PromptsAPI
-        from .traces import TracesAPI
-
-        self.prompts = PromptsAPI(self)
+        self.prompts = PromptsAPI(
+            self, coalesce_window_ms=coalesce_window_ms if coalesce_renders else None
+        )
         self.traces = TracesAPI(self)
-        logger.info(f"Dakora client initialized for {self.base_url}")
+        logger.info("Dakora client initialized for %s", self.base_url)
 
     async def _get_project_id(self) -> str:
         """Get project ID from user context (cached after first call)"""
         if self._project_id is None:
-            logger.debug("Fetching project context from /api/me/context")
-            response = await self.get("/api/me/context")
-            response.raise_for_status()
-            data = response.json()
-            self._project_id = data["project_id"]
-            logger.info(f"Project context loaded: project_id={self._project_id}")
-        
+            async with self._project_id_lock:
+                if self._project_id is None:
+                    logger.debug("Fetching project context from /api/me/context")
+                    response = await self.get("/api/me/context")
+                    response.raise_for_status()
+                    data = response.json()
+                    self._project_id = data["project_id"]
+                    logger.info("Project context loaded: project_id=%s", self._project_id)
+
         # At this point, _project_id is guaranteed to be a string (not None)
-        assert self._project_id is not None
+        return cast(str, self._project_id)
 
-        return self._project_id
+    async def _prompts_base(self) -> str:
+        """Get the project-scoped prompts URL prefix (cached after first call)"""
+        if self._prompts_base_url is None:
+            project_id = await self._get_project_id()
+            self._prompts_base_url = f"/api/projects/{project_id}/prompts"
+        return self._prompts_base_url
 
-    async def _request(self, method: str, path: str, **kwargs: Any) -> httpx.Response:
-        """Internal helper to ensure requests stay scoped to the Dakora API."""
-        if path.startswith(("http://", "https://", "//")):
+    def _prepare(self, path: str | httpx.URL, kwargs: dict[str, Any]) -> dict[str, Any]:
+        """Validate the path and sanitize request kwargs, keeping requests scoped to the Dakora API.
+
+        This is synchronous so each request helper can await the HTTP client
+        directly, without an extra coroutine frame per call.
+        """
+        if self._profiler is not None:
+            self._profiler.ensure_started()
+        if isinstance(path, httpx.URL):
+            # Prebuilt absolute URLs are accepted only for the configured server
+            if path.scheme != self._origin.scheme or path.netloc != self._origin.netloc:
+                raise ValueError("URL must point to the configured Dakora API server")
+        elif path.startswith(("http://", "https://", "//")):
             raise ValueError("path must be a relative Dakora API path")
+        # json=None means "no body" to httpx, so it is left for httpx to drop
+        encode_json = kwargs.get("json") is not None and _json.orjson is not None
+        if encode_json:
+            kwargs["content"] = _json.dumps(kwargs.pop("json"))
         headers = kwargs.pop("headers", None)
         if headers is not None:
+            # Any casing of the key header is dropped; the client's own key always wins
             sanitized = {k: v for k, v in headers.items() if k.lower() != "x-api-key"}
             if self.__api_key:
                 sanitized["X-API-Key"] = self.__api_key
+            # Like httpx, only add a content type when the caller did not set one (in any casing)
+            if encode_json and not any(k.lower() == "content-type" for k in sanitized):
+                sanitized.update(_json.JSON_HEADERS)
             kwargs["headers"] = sanitized
-        return await self.__http.request(method, path, **kwargs)
-
-    async def request(self, method: str, path: str, **kwargs: Any) -> httpx.Response:
-        """Public wrapper for making scoped HTTP requests."""
-        return await self._request(method, path, **kwargs)
+        elif encode_json:
+            # The API key is already in the client's default headers, so the
+            # shared constant can be passed as-is without copying
+            kwargs["headers"] = _json.JSON_HEADERS
+        return kwargs
 
-    async def get(self, path: str, **kwargs: Any) -> httpx.Response:
-        return await self.request("GET", path, **kwargs)
-
-    async def post(self, path: str, **kwargs: Any) -> httpx.Response:
-        return await self.request("POST", path, **kwargs)
-
-    async def put(self, path: str, **kwargs: Any) -> httpx.Response:
-        return await self.request("PUT", path, **kwargs)
+    async def _request(self, method: str, path: str | httpx.URL, **kwargs: Any) -> httpx.Response:
+        """Internal helper to ensure requests stay scoped to the Dakora API."""
+        return await self.__send(method, path, **self._prepare(path, kwargs))
 
-    async def delete(self, path: str, **kwargs: Any) -> httpx.Response:
-        return await self.request("DELETE", path, **kwargs)
+    async def request(self, method: str, path: str | httpx.URL, **kwargs: Any) -> httpx.Response:
+        """Public wrapper for making scoped HTTP requests."""
+        return await self.__send(method, path, **self._prepare(path, kwargs))
+
+    async def get(self, path: str | httpx.URL, **kwargs: Any) -> httpx.Response:
+        return await self.__send("GET", path, **self._prepare(path, kwargs))
+
+    async def post(self, path: str | httpx.URL, **kwargs: Any) -> httpx.Response:
+        return await self.__send("POST", path, **self._prepare(path, kwargs))
+
+    async def put(self, path: str | httpx.URL, **kwargs: Any) -> httpx.Response:
+        return await self.__send("PUT", path, **self._prepare(path, kwargs))
+
+    async def delete(self, path: str | httpx.URL, **kwargs: Any) -> httpx.Response:
+        return await self.__send("DELETE", path, **self._prepare(path, kwargs))
+
+    def _stream(self, method: str, path: str | httpx.URL, **kwargs: Any) -> Any:
+        """Open a streaming request; use as ``async with client._stream(...) as response``."""
+        return self.__http.stream(method, path, **self._prepare(path, kwargs))
+
+    async def __timed_request(self, method: str, path: str | httpx.URL, **kwargs: Any) -> httpx.Response:
+        """Send a request with a timeout learned from the route's recent latency."""
+        # Key on method and path only, so prebuilt absolute URLs and query strings share an entry
+        route = path.path if isinstance(path, httpx.URL) else path.partition("?")[0]
+        key = f"{method.upper()} {route}"
+        # An explicit timeout, including None (no timeout), is always respected
+        timeout = kwargs.get("timeout")
+        if "timeout" not in kwargs:
+            ewma = self._latency_ewma.get(key, _LATENCY_DEFAULT_S)
+            timeout = min(_TIMEOUT_MAX_S, max(_TIMEOUT_MIN_S, _TIMEOUT_LATENCY_MULTIPLIER * ewma))
+            kwargs["timeout"] = timeout
+
+        start = time.perf_counter()
+        try:
+            response = await self.__http.request(method, path, **kwargs)
+        except httpx.TimeoutException:
+            # Count the full budget as observed latency so the next attempt gets more time
+            if isinstance(timeout, (int, float)):
+                self.__record_latency(key, float(timeout))
+            raise
+        self.__record_latency(key, time.perf_counter() - start)
+        return response
+
+    def __record_latency(self, key: str, elapsed: float) -> None:
+        previous = self._latency_ewma.get(key)
+        if previous is None:
+            if len(self._latency_ewma) >= _LATENCY_MAX_ROUTES:
+                del self._latency_ewma[next(iter(self._latency_ewma))]
+            self._latency_ewma[key] = elapsed
+        else:
+            self._latency_ewma[key] = previous + _LATENCY_EWMA_ALPHA * (elapsed - previous)
 
     async def close(self):
         """Close the HTTP client connection (optional - usually not needed)"""
+        if self._profiler is not None:
+            self._profiler.stop()
+        if self.prompts._coalescer is not None:
+            self.prompts._coalescer.close()
         await self.__http.aclose()
 
     def update_api_key(self, api_key: str | None) -> None:
@@ -1,8 +1,15 @@
 """Prompts API client"""
 
+from __future__ import annotations
+
+import asyncio
+import functools
 import logging
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, AsyncIterator
+
+import httpx
 
+from . import _json
 from .types import RenderResult
 
 if TYPE_CHECKING:
@@ -10,12 +17,177 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger("dakora_client.prompts")
 
+# URL builders relative to the project-scoped prompts root (see _PromptURLs)
+_URL_GET = "{}/{}".format
+_URL_RENDER = "{}/{}/render".format
+_URL_RENDER_BATCH = "{}:renderBatch".format
+
+# Largest number of items the server accepts in one renderBatch request
+_MAX_RENDER_BATCH = 64
+
+# Templates larger than this are streamed to the server instead of buffered
+_STREAM_TEMPLATE_THRESHOLD = 1024 * 1024
+_STREAM_CHUNK_CHARS = 64 * 1024
+
+
+class _PromptURLs:
+    """Prebuilt absolute URLs for one project's prompts endpoints.
+
+    httpx uses absolute ``httpx.URL`` objects as-is instead of parsing and
+    merging a path string with the client's base URL on every request.
+    """
+
+    def __init__(self, root: str):
+        self.list = httpx.URL(root)
+        self.render_batch = httpx.URL(_URL_RENDER_BATCH(root))
+        self.render = functools.lru_cache(maxsize=1024)(
+            lambda template_id: httpx.URL(_URL_RENDER(root, template_id))
+        )
+        self.get = functools.lru_cache(maxsize=1024)(
+            lambda prompt_id: httpx.URL(_URL_GET(root, prompt_id))
+        )
+
+
+class _RenderCoalescer:
+    """Coalesces concurrent render calls into batched renderBatch requests.
+
+    Calls arriving within ``window_ms`` of the first queued call are sent
+    together through ``PromptsAPI.render_many`` and each caller receives its
+    own result. The server fails a whole batch when any item is bad, so a
+    rejected batch is retried item by item and each caller gets its own
+    result or error. Other failures (e.g. network errors) go to every caller.
+    """
+
+    def __init__(self, prompts: PromptsAPI, window_ms: float, max_batch: int = _MAX_RENDER_BATCH):
+        self._prompts = prompts
+        self._window = window_ms / 1000
+        self._max_batch = max_batch
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._queue: asyncio.Queue[tuple[dict[str, Any], asyncio.Future[RenderResult]]] | None = None
+        self._task: asyncio.Task[None] | None = None
+        self._flushes: set[asyncio.Task[None]] = set()
+
+    async def submit(self, request: dict[str, Any]) -> RenderResult:
+        loop = asyncio.get_running_loop()
+        # The worker is started lazily and restarted if the event loop changed
+        if self._task is None or self._task.done() or self._loop is not loop:
+            self._loop = loop
+            self._queue = asyncio.Queue()
+            self._task = loop.create_task(self._run(self._queue))
+
+        future: asyncio.Future[RenderResult] = loop.create_future()
+        self._queue.put_nowait((request, future))  # type: ignore[union-attr]
+        return await future
+
+    async def _run(self, queue: asyncio.Queue[tuple[dict[str, Any], asyncio.Future[RenderResult]]]) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await queue.get()]
+            deadline = loop.time() + self._window
+            try:
+                while len(batch) < self._max_batch:
+                    remaining = deadline - loop.time()
+                    if remaining <= 0:
+                        break
+                    try:
+                        batch.append(await asyncio.wait_for(queue.get(), remaining))
+                    except asyncio.TimeoutError:
+                        break
+            except BaseException:
+                # Cancelled while collecting: release the callers already taken off the queue
+                _cancel_pending(batch)
+                raise
+
+            # Send without blocking collection of the next batch
+            flush = loop.create_task(self._flush(batch))
+            self._flushes.add(flush)
+            flush.add_done_callback(self._flushes.discard)
+
+    async def _flush(self, batch: list[tuple[dict[str, Any], asyncio.Future[RenderResult]]]) -> None:
+        pending = [(request, future) for request, future in batch if not future.done()]
+        if not pending:
+            return
+
+        logger.debug("Coalesced %d render calls into one batch", len(pending))
+        try:
+            results: list[Any] = await self._prompts.render_many([request for request, _ in pending])
+        except httpx.HTTPStatusError as e:
+            if len(pending) == 1:
+                results = [e]
+            else:
+                logger.debug(
+                    "Batch rejected with %d, rendering %d calls individually", e.response.status_code, len(pending)
+                )
+                try:
+                    results = await asyncio.gather(
+                        *(
+                            self._prompts._render_single(request["prompt_id"], request["inputs"], request.get("version"))
+                            for request, _ in pending
+                        ),
+                        return_exceptions=True,
+                    )
+                except BaseException:
+                    _cancel_pending(pending)
+                    raise
+        except Exception as e:
+            for _, future in pending:
+                if not future.done():
+                    future.set_exception(e)
+            return
+        except BaseException:
+            # Cancelled (e.g. by close()): no caller may be left waiting forever
+            _cancel_pending(pending)
+            raise
+
+        for (_, future), result in zip(pending, results):
+            if future.done():
+                continue
+            if isinstance(result, asyncio.CancelledError):
+                future.cancel()
+            elif isinstance(result, BaseException):
+                future.set_exception(result)
+            else:
+                future.set_result(result)
+
+    def close(self) -> None:
+        """Stop the background worker and any in-flight batches.
+
+        Callers still waiting on a queued or in-flight render are cancelled.
+        """
+        for task in (self._task, *self._flushes):
+            if task is not None and not task.done():
+                task.cancel()
+        if self._queue is not None:
+            while not self._queue.empty():
+                _, future = self._queue.get_nowait()
+                if not future.done():
+                    future.cancel()
+        self._task = None
+        self._queue = None
+
+
+def _cancel_pending(batch: list[tuple[dict[str, Any], asyncio.Future[RenderResult]]]) -> None:
+    for _, future in batch:
+        if not future.done():
+            future.cancel()
+
 
 class PromptsAPI:
     """Prompts API client"""
 
-    def __init__(self, client: "Dakora"):
+    def __init__(self, client: "Dakora", coalesce_window_ms: float | None = None):
         self._client = client
+        # Project-scoped endpoint URLs, bound by _resolve_urls once the project is known
+        self._urls: _PromptURLs | None = None
+        self._coalescer = (
+            _RenderCoalescer(self, coalesce_window_ms) if coalesce_window_ms is not None else None
+        )
+
+    async def _resolve_urls(self) -> _PromptURLs:
+        """Bind the prompts URLs for the resolved project so calls skip the project lookup."""
+        urls = _PromptURLs(self._client.base_url + await self._client._prompts_base())
+        self._urls = urls
+        return urls
 
     async def list(self) -> list[str]:
         """List all prompt template IDs.
@@ -27,18 +199,39 @@ class PromptsAPI:
             templates = await client.prompts.list()
             # ["greeting", "email", "summary"]
         """
-        project_id = await self._client._get_project_id() # type: ignore
-        url = f"/api/projects/{project_id}/prompts"
+        url = (self._urls or await self._resolve_urls()).list
 
-        logger.debug(f"GET {url}")
+        logger.debug("GET %s", url)
         response = await self._client.get(url)
-        logger.debug(f"GET {url} -> {response.status_code}")
+        logger.debug("GET %s -> %d", url, response.status_code)
 
         response.raise_for_status()
-        templates = response.json()
-        logger.info(f"Listed {len(templates)} prompts")
+        templates = _json.loads(response)
+        logger.info("Listed %d prompts", len(templates))
         return templates
 
+    async def list_iter(self) -> AsyncIterator[str]:
+        """Iterate over prompt template IDs as the response streams in.
+
+        Unlike list(), IDs are yielded before the full response has arrived,
+        which keeps memory flat for projects with many prompts. Incremental
+        parsing requires ijson; without it the response is read in full first.
+
+        Example:
+            async for prompt_id in client.prompts.list_iter():
+                print(prompt_id)
+        """
+        url = (self._urls or await self._resolve_urls()).list
+
+        logger.debug("GET %s (streaming)", url)
+        async with self._client._stream("GET", url) as response:
+            logger.debug("GET %s -> %d", url, response.status_code)
+            if response.is_error:
+                await response.aread()
+            response.raise_for_status()
+            async for prompt_id in _json.aiter_array_items(response):
+                yield prompt_id
+
     async def render(self, template_id: str, inputs: dict[str, Any], version: str | None = None) -> RenderResult:
         """Render a prompt template with inputs and return execution context.
 
@@ -59,20 +252,17 @@ class PromptsAPI:
             print(result.prompt_id)  # "greeting"
             print(result.version)  # "1.0.0"
         """
-        project_id = await self._client._get_project_id() # type: ignore
-        url = f"/api/projects/{project_id}/prompts/{template_id}/render"
+        if self._coalescer is not None:
+            request: dict[str, Any] = {"prompt_id": template_id, "inputs": inputs}
+            if version:
+                request["version"] = version
+            return await self._coalescer.submit(request)
+        return await self._render_single(template_id, inputs, version)
 
-        payload: dict[str, Any] = {"inputs": inputs}
-        if version:
-            payload["version"] = version
-
-        logger.debug(f"POST {url} with {len(inputs)} inputs")
-        response = await self._client.post(url, json=payload)
-        logger.debug(f"POST {url} -> {response.status_code}")
+    async def _render_single(self, template_id: str, inputs: dict[str, Any], version: str | None) -> RenderResult:
+        """Render one prompt through the single render endpoint, bypassing coalescing."""
+        data = await self._render_data(template_id, inputs, version)
 
-        response.raise_for_status()
-        data = response.json()
-        
         result = RenderResult(
             text=data["rendered"],
             prompt_id=template_id,
@@ -80,10 +270,102 @@ class PromptsAPI:
             inputs=inputs,
             metadata={},
         )
-        
-        logger.info(f"Rendered prompt '{template_id}' v{result.version} ({len(result.text)} chars)")
+
+        logger.info("Rendered prompt '%s' v%s (%d chars)", template_id, result.version, len(result.text))
         return result
 
+    async def render_text(self, template_id: str, inputs: dict[str, Any], version: str | None = None) -> str:
+        """Render a prompt template and return only the rendered text.
+
+        Use this when template tracking metadata is not needed; it skips
+        building a RenderResult.
+
+        Args:
+            template_id: ID of the template to render
+            inputs: Variables to substitute in the template
+            version: Specific version to render (optional, defaults to latest)
+
+        Returns:
+            The rendered prompt text
+
+        Example:
+            text = await client.prompts.render_text("greeting", {"name": "Alice"})
+        """
+        if self._coalescer is not None:
+            return (await self.render(template_id, inputs, version)).text
+        return (await self._render_data(template_id, inputs, version))["rendered"]
+
+    async def _render_data(self, template_id: str, inputs: dict[str, Any], version: str | None) -> dict[str, Any]:
+        url = (self._urls or await self._resolve_urls()).render(template_id)
+
+        payload: dict[str, Any] = {"inputs": inputs}
+        if version:
+            payload["version"] = version
+
+        logger.debug("POST %s with %d inputs", url, len(inputs))
+        response = await self._client.post(url, json=payload)
+        logger.debug("POST %s -> %d", url, response.status_code)
+
+        response.raise_for_status()
+        # Decoded straight from the body bytes; "rendered" is used without copying
+        return _json.loads(response)
+
+    async def render_many(self, requests: list[dict[str, Any]]) -> list[RenderResult]:
+        """Render several prompt templates in a single round trip.
+
+        Requests beyond the server's batch limit of 64 are sent in further
+        renderBatch calls, one after another.
+
+        Args:
+            requests: Render requests, each a dict with ``prompt_id``, ``inputs``
+                and an optional ``version``
+
+        Returns:
+            List of RenderResult in the same order as ``requests``
+
+        Example:
+            results = await client.prompts.render_many([
+                {"prompt_id": "greeting", "inputs": {"name": "Alice"}},
+                {"prompt_id": "email", "inputs": {"name": "Bob"}, "version": "2.0.0"},
+            ])
+            print(results[0].text)
+        """
+        url = (self._urls or await self._resolve_urls()).render_batch
+
+        items: list[dict[str, Any]] = []
+        for request in requests:
+            item: dict[str, Any] = {
+                "prompt_id": request["prompt_id"],
+                "inputs": request.get("inputs") or {},
+            }
+            if request.get("version"):
+                item["version"] = request["version"]
+            items.append(item)
+
+        data: list[dict[str, Any]] = []
+        for start in range(0, len(items), _MAX_RENDER_BATCH):
+            chunk = items[start : start + _MAX_RENDER_BATCH]
+            logger.debug("POST %s with %d items", url, len(chunk))
+            response = await self._client.post(url, json={"items": chunk})
+            logger.debug("POST %s -> %d", url, response.status_code)
+
+            response.raise_for_status()
+            data.extend(_json.loads(response))
+
+        results = [
+            RenderResult(
+                text=rendered["rendered"],
+                prompt_id=item["prompt_id"],
+                version=rendered.get("version", item.get("version") or "latest"),
+                inputs=item["inputs"],
+                metadata={},
+            )
+            for item, rendered in zip(items, data, strict=True)
+        ]
+
+        logger.info("Rendered %d prompts in batch", len(results))
+        return results
+
     async def create(
         self,
         prompt_id: str,
@@ -117,25 +399,28 @@ class PromptsAPI:
                 metadata={"category": "greetings"}
             )
         """
-        project_id = await self._client._get_project_id()  # type: ignore
-        url = f"/api/projects/{project_id}/prompts"
+        url = (self._urls or await self._resolve_urls()).list
 
         payload = {
             "id": prompt_id,
             "version": version,
-            "template": template,
             "description": description,
             "inputs": inputs or {},
             "metadata": metadata or {},
         }
 
-        logger.debug(f"POST {url} - creating prompt '{prompt_id}'")
-        response = await self._client.post(url, json=payload)
-        logger.debug(f"POST {url} -> {response.status_code}")
+        logger.debug("POST %s - creating prompt '%s'", url, prompt_id)
+        if len(template) > _STREAM_TEMPLATE_THRESHOLD:
+            body = _json.iter_dumps_with_string(payload, "template", template, _STREAM_CHUNK_CHARS)
+            response = await self._client.post(url, content=body, headers=_json.JSON_HEADERS)
+        else:
+            payload["template"] = template
+            response = await self._client.post(url, json=payload)
+        logger.debug("POST %s -> %d", url, response.status_code)
 
         response.raise_for_status()
-        data = response.json()
-        logger.info(f"Created prompt '{prompt_id}' v{version}")
+        data = _json.loads(response)
+        logger.info("Created prompt '%s' v%s", prompt_id, version)
         return data
 
     async def get(self, prompt_id: str) -> dict[str, Any]:
@@ -151,14 +436,13 @@ class PromptsAPI:
             prompt = await client.prompts.get("greeting")
             print(prompt["template"])
         """
-        project_id = await self._client._get_project_id()  # type: ignore
-        url = f"/api/projects/{project_id}/prompts/{prompt_id}"
+        url = (self._urls or await self._resolve_urls()).get(prompt_id)
 
-        logger.debug(f"GET {url}")
+        logger.debug("GET %s", url)
         response = await self._client.get(url)
-        logger.debug(f"GET {url} -> {response.status_code}")
+        logger.debug("GET %s -> %d", url, response.status_code)
 
         response.raise_for_status()
-        data = response.json()
-        logger.info(f"Retrieved prompt '{prompt_id}'")
+        data = _json.loads(response)
+        logger.info("Retrieved prompt '%s'", prompt_id)
         return data
@@ -98,13 +98,13 @@ class TracesAPI:
             "cost_usd": cost_usd,
         }
 
-        logger.debug(f"POST {url} (trace_id={trace_id})")
+        logger.debug("POST %s (trace_id=%s)", url, trace_id)
         response = await self._client.post(url, json=payload)
-        logger.debug(f"POST {url} -> {response.status_code}")
+        logger.debug("POST %s -> %d", url, response.status_code)
 
         response.raise_for_status()
         result = response.json()
-        logger.info(f"Created trace: {trace_id}")
+        logger.info("Created trace: %s", trace_id)
         return result
 
     async def list(
@@ -161,15 +161,15 @@ class TracesAPI:
         if agent_id:
             params["agent_id"] = agent_id
 
-        logger.debug(f"GET {url} with filters: {params}")
+        logger.debug("GET %s with filters: %s", url, params)
         response = await self._client.get(url, params=params)
-        logger.debug(f"GET {url} -> {response.status_code}")
+        logger.debug("GET %s -> %d", url, response.status_code)
 
         response.raise_for_status()
         data = response.json()
         executions = data.get("executions", [])
         total = data.get("total", 0)
-        logger.info(f"Listed {len(executions)} traces (total: {total})")
+        logger.info("Listed %d traces (total: %s)", len(executions), total)
         
         if include_metadata:
             return data
@@ -200,11 +200,11 @@ class TracesAPI:
         """
         url = f"/api/projects/{project_id}/executions/{trace_id}"
 
-        logger.debug(f"GET {url}")
+        logger.debug("GET %s", url)
         response = await self._client.get(url)
-        logger.debug(f"GET {url} -> {response.status_code}")
+        logger.debug("GET %s -> %d", url, response.status_code)
 
         response.raise_for_status()
         trace = response.json()
-        logger.info(f"Retrieved trace: {trace_id}")
+        logger.info("Retrieved trace: %s", trace_id)
         return trace
@@ -1,7 +1,13 @@
 """Tests for Dakora client initialization"""
 
+import asyncio
+import json
 import os
+import time
+
+import httpx
 import pytest
+from httpx import Response
 from dakora_client import Dakora
 
 pytestmark = pytest.mark.asyncio
@@ -71,6 +77,23 @@ class TestDakoraClient:
 
         await client.close()
 
+    async def test_get_project_id_single_flight(self, mock_api):
+        """Test that concurrent callers trigger only one context request"""
+        async def slow_context(request):
+            await asyncio.sleep(0.01)
+            return Response(200, json={"project_id": "test-project-123"})
+
+        context_route = mock_api.get("https://api.dakora.io/api/me/context")
+        context_route.mock(side_effect=slow_context)
+        client = Dakora(api_key="dk_test")
+
+        project_ids = await asyncio.gather(*(client._get_project_id() for _ in range(10)))
+
+        assert set(project_ids) == {"test-project-123"}
+        assert context_route.call_count == 1
+
+        await client.close()
+
     async def test_get_project_id_explicit(self):
         """Test that explicit project_id is used without API call"""
         client = Dakora(api_key="dk_test", project_id="explicit-project")
@@ -80,3 +103,302 @@ class TestDakoraClient:
         assert project_id == "explicit-project"
 
         await client.close()
+
+    async def test_prompts_base_cached(self, mock_project_context):
+        """Test that the prompts URL prefix is built once and reused"""
+        client = Dakora(api_key="dk_test")
+
+        base = await client._prompts_base()
+        assert base == "/api/projects/test-project-123/prompts"
+        assert client._prompts_base_url == base
+        assert await client._prompts_base() is base
+
+        await client.close()
+
+    async def test_request_headers_cannot_override_api_key(self, mock_api):
+        """Test that per-request headers never replace the configured API key"""
+        route = mock_api.get("https://api.dakora.io/api/health")
+        route.mock(return_value=Response(200, json={}))
+        client = Dakora(api_key="dk_real")
+
+        await client.get("/api/health", headers={"x-API-key": "dk_forged", "X-Trace": "1"})
+
+        request = route.calls[0].request
+        assert request.headers.get_list("x-api-key") == ["dk_real"]
+        assert request.headers["X-Trace"] == "1"
+
+        await client.close()
+
+    async def test_request_json_none_sends_no_body(self, mock_api):
+        """Test that json=None sends an empty body, as it does with plain httpx"""
+        route = mock_api.post("https://api.dakora.io/api/health")
+        route.mock(return_value=Response(200, json={}))
+        client = Dakora(api_key="dk_test")
+
+        await client.post("/api/health", json=None)
+
+        request = route.calls[0].request
+        assert request.content == b""
+        assert "content-type" not in request.headers
+
+        await client.close()
+
+    async def test_request_json_keeps_caller_content_type(self, mock_api):
+        """Test that a caller's content type is sent once, whatever its casing"""
+        route = mock_api.post("https://api.dakora.io/api/health")
+        route.mock(return_value=Response(200, json={}))
+        client = Dakora(api_key="dk_test")
+
+        await client.post(
+            "/api/health", json={"a": 1}, headers={"content-type": "application/json; charset=utf-8"}
+        )
+
+        request = route.calls[0].request
+        assert request.headers.get_list("content-type") == ["application/json; charset=utf-8"]
+
+        await client.close()
+
+    async def test_request_json_beyond_orjson_range(self, mock_api):
+        """Test that payloads orjson cannot encode fall back to the stdlib encoder"""
+        route = mock_api.post("https://api.dakora.io/api/health")
+        route.mock(return_value=Response(200, json={}))
+        client = Dakora(api_key="dk_test")
+
+        await client.post("/api/health", json={"a": 2**70})
+
+        assert json.loads(route.calls[0].request.content) == {"a": 2**70}
+
+        await client.close()
+
+    async def test_request_rejects_foreign_url(self):
+        """Test that prebuilt URLs for other hosts are refused"""
+        client = Dakora(api_key="dk_test")
+
+        with pytest.raises(ValueError):
+            await client.get(httpx.URL("https://evil.example.com/api/me/context"))
+
+        await client.close()
+
+    async def test_adaptive_timeouts(self, mock_api):
+        """Test that adaptive timeouts learn from observed latency per path"""
+        route = mock_api.get("https://api.dakora.io/api/health")
+        route.mock(return_value=Response(200, json={}))
+        client = Dakora(api_key="dk_test", adaptive_timeouts=True)
+
+        await client.get("/api/health")
+        # Unknown paths start from the default budget
+        assert route.calls[0].request.extensions["timeout"]["read"] == 20.0
+        assert "GET /api/health" in client._latency_ewma
+
+        await client.get("/api/health")
+        # Fast responses shrink the budget down to the floor
+        assert route.calls[1].request.extensions["timeout"]["read"] == 1.0
+
+        await client.get("/api/health", timeout=7.0)
+        # An explicit timeout is always respected
+        assert route.calls[2].request.extensions["timeout"]["read"] == 7.0
+
+        await client.close()
+
+    async def test_adaptive_timeouts_explicit_none(self, mock_api):
+        """Test that timeout=None still disables the timeout with adaptive timeouts on"""
+        route = mock_api.get("https://api.dakora.io/api/health")
+        route.mock(return_value=Response(200, json={}))
+        client = Dakora(api_key="dk_test", adaptive_timeouts=True)
+
+        await client.get("/api/health", timeout=None)
+
+        assert set(route.calls[0].request.extensions["timeout"].values()) == {None}
+
+        await client.close()
+
+    async def test_adaptive_timeouts_route_keys(self, mock_api, monkeypatch):
+        """Test that latency is tracked per route and the number of routes is bounded"""
+        from dakora_client import client as client_module
+
+        monkeypatch.setattr(client_module, "_LATENCY_MAX_ROUTES", 3)
+        mock_api.get(url__startswith="https://api.dakora.io/api/").mock(return_value=Response(200, json={}))
+        client = Dakora(api_key="dk_test", adaptive_timeouts=True)
+
+        await client.get(httpx.URL("https://api.dakora.io/api/health"))
+        await client.get("/api/health?verbose=1")
+        assert list(client._latency_ewma) == ["GET /api/health"]
+
+        for name in ("a", "b", "c"):
+            await client.get(f"/api/{name}")
+        assert list(client._latency_ewma) == ["GET /api/a", "GET /api/b", "GET /api/c"]
+
+        await client.close()
+
+    async def test_unknown_transport(self):
+        """Test that an unsupported transport name is rejected"""
+        with pytest.raises(ValueError):
+            Dakora(transport="urllib")
+
+    async def test_aiohttp_transport(self):
+        """Test that the aiohttp transport round-trips requests through a real server"""
+        web = pytest.importorskip("aiohttp.web")
+
+        async def render(request):
+            body = await request.json()
+            return web.json_response({
+                "rendered": f"Hello {body['inputs']['name']}!",
+                "api_key": request.headers.get("X-API-Key"),
+            })
+
+        app = web.Application()
+        app.router.add_post("/api/projects/p1/prompts/greeting/render", render)
+        runner = web.AppRunner(app)
+        await runner.setup()
+        site = web.TCPSite(runner, "127.0.0.1", 0)
+        await site.start()
+        port = site._server.sockets[0].getsockname()[1]
+
+        client = Dakora(
+            api_key="dk_test",
+            base_url=f"http://127.0.0.1:{port}",
+            project_id="p1",
+            transport="aiohttp",
+        )
+        try:
+            response = await client.post(
+                "/api/projects/p1/prompts/greeting/render", json={"inputs": {"name": "Alice"}}
+            )
+            response.raise_for_status()
+            assert response.json() == {"rendered": "Hello Alice!", "api_key": "dk_test"}
+
+            result = await client.prompts.render("greeting", {"name": "Bob"})
+            assert result.text == "Hello Bob!"
+        finally:
+            await client.close()
+            await runner.cleanup()
+
+    async def test_aiohttp_transport_streamed_create(self, monkeypatch):
+        """Test that a streamed create() body is sent correctly over the aiohttp transport"""
+        web = pytest.importorskip("aiohttp.web")
+        from dakora_client import prompts
+
+        monkeypatch.setattr(prompts, "_STREAM_TEMPLATE_THRESHOLD", 10)
+        monkeypatch.setattr(prompts, "_STREAM_CHUNK_CHARS", 7)
+        received = {}
+
+        async def create(request):
+            received["transfer_encoding"] = request.headers.get("Transfer-Encoding")
+            received["body"] = await request.json()
+            return web.json_response({"id": received["body"]["id"]}, status=201)
+
+        app = web.Application()
+        app.router.add_post("/api/projects/p1/prompts", create)
+        runner = web.AppRunner(app)
+        await runner.setup()
+        site = web.TCPSite(runner, "127.0.0.1", 0)
+        await site.start()
+        port = site._server.sockets[0].getsockname()[1]
+
+        client = Dakora(
+            api_key="dk_test",
+            base_url=f"http://127.0.0.1:{port}",
+            project_id="p1",
+            transport="aiohttp",
+        )
+        template = "Hello {{ name }}, welcome aboard! " * 5
+        try:
+            assert await client.prompts.create("big", template) == {"id": "big"}
+            assert received["transfer_encoding"] == "chunked"
+            assert received["body"]["template"] == template
+        finally:
+            await client.close()
+            await runner.cleanup()
+
+    async def test_aiohttp_transport_streams_response(self):
+        """Test that response bodies are streamed, not buffered, over the aiohttp transport"""
+        web = pytest.importorskip("aiohttp.web")
+        first_chunk_seen = asyncio.Event()
+
+        async def stream(request):
+            response = web.StreamResponse()
+            await response.prepare(request)
+            await response.write(b'["a",')
+            # The rest is only sent once the client has read the first chunk
+            await first_chunk_seen.wait()
+            await response.write(b'"b"]')
+            return response
+
+        app = web.Application()
+        app.router.add_get("/api/stream", stream)
+        runner = web.AppRunner(app)
+        await runner.setup()
+        site = web.TCPSite(runner, "127.0.0.1", 0)
+        await site.start()
+        port = site._server.sockets[0].getsockname()[1]
+
+        client = Dakora(api_key="dk_test", base_url=f"http://127.0.0.1:{port}", transport="aiohttp")
+
+        async def read_chunks():
+            chunks = []
+            async with client._stream("GET", "/api/stream") as response:
+                async for chunk in response.aiter_bytes():
+                    chunks.append(chunk)
+                    first_chunk_seen.set()
+            return chunks
+
+        try:
+            chunks = await asyncio.wait_for(read_chunks(), 5)
+            assert chunks[0] == b'["a",'
+            assert b"".join(chunks) == b'["a","b"]'
+        finally:
+            await client.close()
+            await runner.cleanup()
+
+    async def test_aiohttp_transport_connect_timeout(self, monkeypatch):
+        """Test that aiohttp connect timeouts surface as httpx.ConnectTimeout"""
+        aiohttp = pytest.importorskip("aiohttp")
+        from dakora_client._aiohttp_transport import AiohttpTransport
+
+        class TimingOutSession:
+            async def request(self, *args, **kwargs):
+                raise aiohttp.ConnectionTimeoutError("Connection timeout to host")
+
+        monkeypatch.setattr(AiohttpTransport, "_get_session", lambda self: TimingOutSession())
+        client = Dakora(api_key="dk_test", transport="aiohttp")
+
+        with pytest.raises(httpx.ConnectTimeout):
+            await client.get("/api/health")
+
+        await client.close()
+
+    async def test_profile_reports_loop_lag_and_tasks(self, mock_project_context, mock_api):
+        """Test that profile mode reports blocking calls and Dakora task timings"""
+        mock_api.get("https://api.dakora.io/api/projects/test-project-123/prompts").mock(
+            return_value=Response(200, json=[])
+        )
+        samples = []
+        client = Dakora(api_key="dk_test", profile=True, profile_callback=lambda *s: samples.append(s))
+
+        await asyncio.create_task(client.prompts.list())
+        time.sleep(0.1)  # Block the event loop
+        await asyncio.sleep(0.06)
+
+        names = [name for name, _ in samples]
+        assert "PromptsAPI.list" in names
+        assert any(name == "loop_lag" and seconds > 0.03 for name, seconds in samples)
+
+        await client.close()
+        assert asyncio.get_running_loop().get_task_factory() is None
+
+    async def test_profile_two_clients(self, mock_project_context, mock_api):
+        """Test that closing profiled clients in any order stops reporting and restores the loop"""
+        mock_api.get("https://api.dakora.io/api/projects/test-project-123/prompts").mock(
+            return_value=Response(200, json=[])
+        )
+        first_samples, second_samples = [], []
+        first = Dakora(api_key="dk_test", profile=True, profile_callback=lambda *s: first_samples.append(s))
+        second = Dakora(api_key="dk_test", profile=True, profile_callback=lambda *s: second_samples.append(s))
+
+        await first.close()
+        await asyncio.create_task(second.prompts.list())
+        assert "PromptsAPI.list" in [name for name, _ in second_samples]
+        assert "PromptsAPI.list" not in [name for name, _ in first_samples]
+
+        await second.close()
+        assert asyncio.get_running_loop().get_task_factory() is None
@@ -1,5 +1,9 @@
 """Tests for PromptsAPI"""
 
+import asyncio
+import json
+
+import httpx
 import pytest
 import pytest_asyncio
 from httpx import Response
@@ -39,6 +43,31 @@ class TestPromptsAPI:
 
         assert templates == []
 
+    @pytest.mark.parametrize("use_ijson", [True, False])
+    async def test_list_iter(self, client, mock_api, monkeypatch, use_ijson):
+        """Test streaming prompt IDs with and without ijson"""
+        from dakora_client import _json
+
+        if not use_ijson:
+            monkeypatch.setattr(_json, "ijson", None)
+        mock_api.get("https://api.dakora.io/api/projects/test-project-123/prompts").mock(
+            return_value=Response(200, json=["greeting", "email", "summary"])
+        )
+
+        templates = [prompt_id async for prompt_id in client.prompts.list_iter()]
+
+        assert templates == ["greeting", "email", "summary"]
+
+    async def test_list_iter_error(self, client, mock_api):
+        """Test that streaming a failed list raises"""
+        mock_api.get("https://api.dakora.io/api/projects/test-project-123/prompts").mock(
+            return_value=Response(500, json={"detail": "boom"})
+        )
+
+        with pytest.raises(Exception):  # httpx.HTTPStatusError
+            async for _ in client.prompts.list_iter():
+                pass
+
     async def test_render_prompt(self, client, mock_api):
         """Test rendering a prompt template"""
         mock_api.post("https://api.dakora.io/api/projects/test-project-123/prompts/greeting/render").mock(
@@ -50,6 +79,34 @@ class TestPromptsAPI:
         assert result.text == "Hello Alice!"
         assert result.prompt_id == "greeting"
 
+    @pytest.mark.parametrize("use_orjson", [True, False])
+    async def test_render_prompt_json_body(self, client, mock_api, monkeypatch, use_orjson):
+        """Test that the render payload is sent as JSON with or without orjson"""
+        from dakora_client import _json
+
+        if not use_orjson:
+            monkeypatch.setattr(_json, "orjson", None)
+        route = mock_api.post("https://api.dakora.io/api/projects/test-project-123/prompts/greeting/render")
+        route.mock(return_value=Response(200, json={"rendered": "Hello Ünal!"}))
+
+        result = await client.prompts.render("greeting", {"name": "Ünal"}, version="1.0.0")
+
+        request = route.calls[0].request
+        assert request.headers["content-type"] == "application/json"
+        assert request.headers["X-API-Key"] == "dk_test"
+        assert json.loads(request.content) == {"inputs": {"name": "Ünal"}, "version": "1.0.0"}
+        assert result.text == "Hello Ünal!"
+
+    async def test_render_text(self, client, mock_api):
+        """Test rendering a prompt template straight to text"""
+        mock_api.post("https://api.dakora.io/api/projects/test-project-123/prompts/greeting/render").mock(
+            return_value=Response(200, json={"rendered": "Hello Alice!", "inputs_used": {"name": "Alice"}})
+        )
+
+        text = await client.prompts.render_text("greeting", {"name": "Alice"})
+
+        assert text == "Hello Alice!"
+
     async def test_render_prompt_with_multiple_inputs(self, client, mock_api):
         """Test rendering with multiple input variables"""
         mock_api.post("https://api.dakora.io/api/projects/test-project-123/prompts/email/render").mock(
@@ -85,6 +142,170 @@ class TestPromptsAPI:
         with pytest.raises(Exception):  # httpx.HTTPStatusError
             await client.prompts.render("greeting", {})
 
+    async def test_render_many(self, client, mock_api):
+        """Test rendering several prompts in one batch request"""
+        route = mock_api.post("https://api.dakora.io/api/projects/test-project-123/prompts:renderBatch")
+        route.mock(
+            return_value=Response(
+                200,
+                json=[
+                    {"rendered": "Hello Alice!", "inputs_used": {"name": "Alice"}},
+                    {"rendered": "Dear Bob", "inputs_used": {"name": "Bob"}},
+                ],
+            )
+        )
+
+        results = await client.prompts.render_many([
+            {"prompt_id": "greeting", "inputs": {"name": "Alice"}},
+            {"prompt_id": "email", "inputs": {"name": "Bob"}, "version": "2.0.0"},
+        ])
+
+        assert route.call_count == 1
+        assert [r.text for r in results] == ["Hello Alice!", "Dear Bob"]
+        assert [r.prompt_id for r in results] == ["greeting", "email"]
+        assert results[0].version == "latest"
+        assert results[1].version == "2.0.0"
+
+        body = json.loads(route.calls[0].request.content)
+        assert body == {
+            "items": [
+                {"prompt_id": "greeting", "inputs": {"name": "Alice"}},
+                {"prompt_id": "email", "inputs": {"name": "Bob"}, "version": "2.0.0"},
+            ]
+        }
+
+    async def test_render_many_splits_large_batches(self, client, mock_api):
+        """Test that more than 64 requests are sent as several batch requests"""
+
+        def respond(request):
+            items = json.loads(request.content)["items"]
+            return Response(200, json=[{"rendered": i["prompt_id"], "inputs_used": {}} for i in items])
+
+        route = mock_api.post("https://api.dakora.io/api/projects/test-project-123/prompts:renderBatch")
+        route.mock(side_effect=respond)
+
+        results = await client.prompts.render_many([{"prompt_id": f"p{i}"} for i in range(100)])
+
+        assert [len(json.loads(c.request.content)["items"]) for c in route.calls] == [64, 36]
+        assert [r.text for r in results] == [f"p{i}" for i in range(100)]
+
+    async def test_render_many_not_found(self, client, mock_api):
+        """Test that a failing batch raises"""
+        mock_api.post("https://api.dakora.io/api/projects/test-project-123/prompts:renderBatch").mock(
+            return_value=Response(404, json={"detail": "Prompt 'missing' not found"})
+        )
+
+        with pytest.raises(Exception):  # httpx.HTTPStatusError
+            await client.prompts.render_many([{"prompt_id": "missing", "inputs": {}}])
+
+    async def test_render_coalesces_concurrent_calls(self, mock_project_context, mock_api):
+        """Test that concurrent renders share one batch request when coalescing is on"""
+        client = Dakora(api_key="dk_test", coalesce_renders=True, coalesce_window_ms=5)
+        batch_route = mock_api.post("https://api.dakora.io/api/projects/test-project-123/prompts:renderBatch")
+        batch_route.mock(
+            return_value=Response(
+                200,
+                json=[
+                    {"rendered": "Hello Alice!", "inputs_used": {"name": "Alice"}},
+                    {"rendered": "Hello Bob!", "inputs_used": {"name": "Bob"}},
+                ],
+            )
+        )
+
+        first, second = await asyncio.gather(
+            client.prompts.render("greeting", {"name": "Alice"}),
+            client.prompts.render("greeting", {"name": "Bob"}),
+        )
+
+        assert batch_route.call_count == 1
+        assert first.text == "Hello Alice!"
+        assert second.text == "Hello Bob!"
+
+        await client.close()
+
+    async def test_render_coalesced_error_propagates(self, mock_project_context, mock_api):
+        """Test that a failed batch raises in every coalesced caller"""
+        client = Dakora(api_key="dk_test", coalesce_renders=True)
+        mock_api.post("https://api.dakora.io/api/projects/test-project-123/prompts:renderBatch").mock(
+            return_value=Response(404, json={"detail": "Prompt 'missing' not found"})
+        )
+
+        with pytest.raises(Exception):  # httpx.HTTPStatusError
+            await client.prompts.render("missing", {})
+
+        await client.close()
+
+    async def test_render_coalesced_error_isolated(self, mock_project_context, mock_api):
+        """Test that one bad render in a batch does not fail the other callers"""
+        client = Dakora(api_key="dk_test", coalesce_renders=True, coalesce_window_ms=5)
+        batch_route = mock_api.post("https://api.dakora.io/api/projects/test-project-123/prompts:renderBatch")
+        batch_route.mock(return_value=Response(404, json={"detail": "Prompt 'missing' not found"}))
+        mock_api.post("https://api.dakora.io/api/projects/test-project-123/prompts/greeting/render").mock(
+            return_value=Response(200, json={"rendered": "Hello Alice!"})
+        )
+        mock_api.post("https://api.dakora.io/api/projects/test-project-123/prompts/missing/render").mock(
+            return_value=Response(404, json={"detail": "Template not found"})
+        )
+
+        good, bad = await asyncio.gather(
+            client.prompts.render("greeting", {"name": "Alice"}),
+            client.prompts.render("missing", {}),
+            return_exceptions=True,
+        )
+
+        assert batch_route.call_count == 1
+        assert good.text == "Hello Alice!"
+        assert isinstance(bad, httpx.HTTPStatusError)
+        assert bad.response.status_code == 404
+
+        await client.close()
+
+    @pytest.mark.parametrize("use_orjson", [True, False])
+    async def test_create_streams_large_template(self, client, mock_api, monkeypatch, use_orjson):
+        """Test that large templates are streamed as valid JSON"""
+        from dakora_client import _json, prompts
+
+        if not use_orjson:
+            monkeypatch.setattr(_json, "orjson", None)
+        monkeypatch.setattr(prompts, "_STREAM_TEMPLATE_THRESHOLD", 10)
+        monkeypatch.setattr(prompts, "_STREAM_CHUNK_CHARS", 7)
+        route = mock_api.post("https://api.dakora.io/api/projects/test-project-123/prompts")
+        route.mock(return_value=Response(201, json={"id": "big"}))
+        template = 'Hello "{{ name }}"\n\tÜnïcode 🎉 ' * 5
+
+        await client.prompts.create("big", template, description="large")
+
+        request = route.calls[0].request
+        assert request.headers["content-type"] == "application/json"
+        assert json.loads(request.content) == {
+            "id": "big",
+            "version": "1.0.0",
+            "template": template,
+            "description": "large",
+            "inputs": {},
+            "metadata": {},
+        }
+
+    @pytest.mark.parametrize("close_after", [0.0, 0.05])
+    async def test_render_coalesced_close_releases_callers(self, mock_project_context, mock_api, close_after):
+        """Test that closing the client mid-batch does not leave callers hanging"""
+        async def slow_batch(request):
+            await asyncio.sleep(1)
+            return Response(200, json=[{"rendered": "late"}])
+
+        client = Dakora(api_key="dk_test", coalesce_renders=True, coalesce_window_ms=20)
+        mock_api.post("https://api.dakora.io/api/projects/test-project-123/prompts:renderBatch").mock(
+            side_effect=slow_batch
+        )
+
+        task = asyncio.ensure_future(client.prompts.render("greeting", {"name": "Alice"}))
+        # 0.0: still queued or collecting; 0.05: batch request in flight
+        await asyncio.sleep(close_after)
+        await client.close()
+
+        with pytest.raises(asyncio.CancelledError):
+            await asyncio.wait_for(task, 2)
+
     async def test_api_uses_project_id(self, client, mock_api):
         """Test that API calls use the correct project_id"""
         # Mock the list endpoint
@@ -113,3 +334,14 @@ class TestPromptsAPI:
         assert request.headers["X-API-Key"] == "dk_secret_key"
 
         await client.close()
+
+    async def test_specialized_after_first_call(self, client, mock_api):
+        """Test that the prompts URLs are bound once the project is resolved"""
+        mock_api.get("https://api.dakora.io/api/projects/test-project-123/prompts").mock(
+            return_value=Response(200, json=[])
+        )
+        assert client.prompts._urls is None
+
+        await client.prompts.list()
+
+        assert client.prompts._urls.list == "https://api.dakora.io/api/projects/test-project-123/prompts"
@@ -1,6 +1,6 @@
 """Project-scoped prompts API routes."""
 
-from typing import List, Dict, Any
+from typing import TYPE_CHECKING, List, Dict, Any
 from uuid import UUID
 from fastapi import APIRouter, HTTPException, Depends, Response
 from sqlalchemy.engine import Engine
@@ -18,11 +18,15 @@ from .schemas import (
     UpdateTemplateRequest,
     RenderRequest,
     RenderResponse,
+    BatchRenderRequest,
     VersionHistoryResponse,
     VersionHistoryItem,
     RollbackRequest,
 )
 
+if TYPE_CHECKING:
+    from ..core.renderer import Renderer
+
 router = APIRouter(
     prefix="/api/projects/{project_id}/prompts", tags=["project-prompts"]
 )
@@ -77,6 +81,33 @@ def _get_version_number(project_id: UUID, prompt_id: str, engine: Engine) -> int
         return result[0] if result else None
 
 
+def _render_with(
+    renderer: "Renderer", manager: PromptManager, prompt_id: str, request: RenderRequest
+) -> RenderResponse:
+    """Render a single prompt with an already constructed Renderer.
+
+    Args:
+        renderer: Renderer bound to the project
+        manager: PromptManager instance
+        prompt_id: The ID of the prompt to render
+        request: Render request with input variables
+
+    Returns:
+        RenderResponse with rendered template text
+    """
+    template = manager.load(prompt_id)
+    spec = template if isinstance(template, TemplateSpec) else template.spec
+
+    if request.resolve_includes_only:
+        # Only resolve includes, keep variables as placeholders
+        rendered = renderer.resolve_includes(spec.template)
+    else:
+        # Full render with variable substitution
+        rendered = renderer.render(spec.template, request.inputs)
+
+    return RenderResponse(rendered=rendered, inputs_used=request.inputs)
+
+
 @router.get("", response_model=List[str])
 async def list_prompts(manager: PromptManager = Depends(get_prompt_manager)):
     """List all prompt IDs in the project."""
@@ -291,6 +322,54 @@ async def update_prompt(
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@router.post(":renderBatch", response_model=List[RenderResponse])
+async def render_prompts_batch(
+    request: BatchRenderRequest,
+    project_id: UUID = Depends(validate_project_access),
+    manager: PromptManager = Depends(get_prompt_manager),
+):
+    """Render several prompt templates in a single request.
+
+    Items are rendered in order with a shared Renderer, and the response array
+    preserves the order of the request items. The batch fails as a whole if any
+    item fails, using the same status codes as the single render endpoint.
+
+    Args:
+        request: Batch render request with one entry per prompt to render
+        project_id: Validated project UUID
+        manager: PromptManager instance
+
+    Returns:
+        List of RenderResponse, one per item, in request order
+
+    Raises:
+        404: Prompt not found
+        400: Validation or rendering error
+        500: Internal server error
+    """
+    prompt_id = None
+    try:
+        from ..core.renderer import Renderer
+
+        renderer = Renderer(engine=get_engine(), project_id=project_id)
+        results: List[RenderResponse] = []
+        for item in request.items:
+            prompt_id = item.prompt_id
+            results.append(_render_with(renderer, manager, prompt_id, item))
+        return results
+
+    except TemplateNotFound:
+        raise HTTPException(
+            status_code=404, detail=f"Prompt '{prompt_id}' not found"
+        )
+    except ValidationError as e:
+        raise HTTPException(status_code=400, detail=f"Validation error: {str(e)}")
+    except RuntimeError as e:
+        raise HTTPException(status_code=400, detail=f"Render error: {str(e)}")
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+
 @router.post("/{prompt_id}/render", response_model=RenderResponse)
 async def render_prompt(
     prompt_id: str,
@@ -320,20 +399,8 @@ async def render_prompt(
     try:
         from ..core.renderer import Renderer
 
-        template = manager.load(prompt_id)
-        spec = template if isinstance(template, TemplateSpec) else template.spec
-
-        engine = get_engine()
-        renderer = Renderer(engine=engine, project_id=project_id)
-
-        if request.resolve_includes_only:
-            # Only resolve includes, keep variables as placeholders
-            rendered = renderer.resolve_includes(spec.template)
-        else:
-            # Full render with variable substitution
-            rendered = renderer.render(spec.template, request.inputs)
-
-        return RenderResponse(rendered=rendered, inputs_used=request.inputs)
+        renderer = Renderer(engine=get_engine(), project_id=project_id)
+        return _render_with(renderer, manager, prompt_id, request)
 
     except TemplateNotFound:
         raise HTTPException(
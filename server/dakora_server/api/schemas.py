@@ -40,6 +40,15 @@ class RenderResponse(BaseModel):
     rendered: str
     inputs_used: Dict[str, Any]
 
+
+class BatchRenderItem(RenderRequest):
+    prompt_id: str
+
+
+class BatchRenderRequest(BaseModel):
+    # Same cap as the client's coalesced batches (max_batch=64)
+    items: List[BatchRenderItem] = Field(default_factory=list, max_length=64)
+
 class TemplateUsage(BaseModel):
     """Information about a template used in an execution"""
     prompt_id: str
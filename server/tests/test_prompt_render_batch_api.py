@@ -0,0 +1,104 @@
+"""Unit tests for the batch prompt render endpoint"""
+
+import pytest
+from unittest.mock import MagicMock, patch
+from uuid import uuid4
+
+from dakora_server.core.model import TemplateSpec
+from dakora_server.core.exceptions import TemplateNotFound
+
+
+@pytest.fixture
+def mock_prompt_manager():
+    """Create a mock PromptManager that serves two templates."""
+    specs = {
+        "greeting": TemplateSpec(id="greeting", version="1.0.0", template="Hello {{ name }}!"),
+        "farewell": TemplateSpec(id="farewell", version="1.0.0", template="Bye {{ name }}!"),
+    }
+
+    def load(prompt_id):
+        if prompt_id not in specs:
+            raise TemplateNotFound(prompt_id)
+        return specs[prompt_id]
+
+    manager = MagicMock()
+    manager.load.side_effect = load
+    return manager
+
+
+def test_render_batch_preserves_order(test_client, mock_prompt_manager, override_auth_dependencies):
+    """Test that batch render returns one result per item, in request order."""
+    from dakora_server.api.project_prompts import get_prompt_manager
+    from dakora_server.core.renderer import Renderer
+    from dakora_server.main import app
+
+    project_id = str(uuid4())
+    app.dependency_overrides[get_prompt_manager] = lambda: mock_prompt_manager
+
+    try:
+        with patch("dakora_server.api.project_prompts.get_engine", return_value=None), \
+             patch("dakora_server.core.renderer.Renderer", return_value=Renderer()):
+            response = test_client.post(
+                f"/api/projects/{project_id}/prompts:renderBatch",
+                json={
+                    "items": [
+                        {"prompt_id": "farewell", "inputs": {"name": "Bob"}},
+                        {"prompt_id": "greeting", "inputs": {"name": "Alice"}},
+                    ]
+                },
+            )
+
+        assert response.status_code == 200
+        data = response.json()
+        assert [item["rendered"] for item in data] == ["Bye Bob!", "Hello Alice!"]
+        assert data[1]["inputs_used"] == {"name": "Alice"}
+    finally:
+        app.dependency_overrides.pop(get_prompt_manager, None)
+
+
+def test_render_batch_not_found(test_client, mock_prompt_manager, override_auth_dependencies):
+    """Test that a missing prompt fails the whole batch with 404."""
+    from dakora_server.api.project_prompts import get_prompt_manager
+    from dakora_server.core.renderer import Renderer
+    from dakora_server.main import app
+
+    project_id = str(uuid4())
+    app.dependency_overrides[get_prompt_manager] = lambda: mock_prompt_manager
+
+    try:
+        with patch("dakora_server.api.project_prompts.get_engine", return_value=None), \
+             patch("dakora_server.core.renderer.Renderer", return_value=Renderer()):
+            response = test_client.post(
+                f"/api/projects/{project_id}/prompts:renderBatch",
+                json={
+                    "items": [
+                        {"prompt_id": "greeting", "inputs": {"name": "Alice"}},
+                        {"prompt_id": "missing", "inputs": {}},
+                    ]
+                },
+            )
+
+        assert response.status_code == 404
+        assert "missing" in response.json()["detail"]
+    finally:
+        app.dependency_overrides.pop(get_prompt_manager, None)
+
+
+def test_render_batch_too_many_items(test_client, mock_prompt_manager, override_auth_dependencies):
+    """Test that batches larger than 64 items are rejected with 422."""
+    from dakora_server.api.project_prompts import get_prompt_manager
+    from dakora_server.main import app
+
+    project_id = str(uuid4())
+    app.dependency_overrides[get_prompt_manager] = lambda: mock_prompt_manager
+
+    try:
+        response = test_client.post(
+            f"/api/projects/{project_id}/prompts:renderBatch",
+            json={"items": [{"prompt_id": "greeting", "inputs": {"name": "Alice"}}] * 65},
+        )
+
+        assert response.status_code == 422
+        mock_prompt_manager.load.assert_not_called()
+    finally:
+        app.dependency_overrides.pop(get_prompt_manager, None)